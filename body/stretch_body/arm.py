@@ -5,6 +5,7 @@ from stretch_body.trajectories import PrismaticTrajectory
 
 import time
 import math
+from functools import cached_property
 
 
 class Arm(PrismaticJoint):
@@ -16,11 +17,21 @@ class Arm(PrismaticJoint):
 
     # ######### Utilties ##############################
 
+    # Conversion factors are computed once on first use (PrismaticJoint.__init__ already converts
+    # the default motion params) so that each conversion in the control loop is a single multiply
+    @cached_property
+    def _m_per_motor_rad(self):
+        return self.params['chain_pitch']*self.params['chain_sprocket_teeth']/self.params['gr_spur']/(math.pi*2)
+
+    @cached_property
+    def _motor_rad_per_m(self):
+        return 1.0/self._m_per_motor_rad
+
     def motor_rad_to_translate_m(self,ang): #input in rad, output m
-        return (self.params['chain_pitch']*self.params['chain_sprocket_teeth']/self.params['gr_spur']/(math.pi*2))*ang
+        return self._m_per_motor_rad*ang
 
     def translate_m_to_motor_rad(self, x):
-        return x/(self.params['chain_pitch']*self.params['chain_sprocket_teeth']/self.params['gr_spur']/(math.pi*2))
+        return self._motor_rad_per_m*x
 
 
     def home(self, end_pos=0.1,to_positive_stop=False, measuring=False):
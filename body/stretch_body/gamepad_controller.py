@@ -1,8 +1,14 @@
 #!/usr/bin/env python3
 from __future__ import print_function
-from inputs import DeviceManager, UnpluggedError, GamepadLED, SystemLED
+from inputs import DeviceManager, UnpluggedError, GamepadLED, SystemLED, EVENT_FORMAT, EVENT_SIZE
 import threading
+import types
+import selectors
+import fcntl
+import struct
 import time
+import io
+import os
 import click
 
 """
@@ -10,7 +16,49 @@ The GamePadController is a threading class that polls for the gamepad inputs (ga
 to the gamepad's USB dongle plugged into the robot.
 """
 
+# evdev codes (linux/input-event-codes.h) of the inputs used below, and the ioctls (linux/input.h)
+# used to read back their current state after the kernel event queue overflows
+EV_KEY = 0x01
+EV_ABS = 0x03
+GAMEPAD_ABS_CODES = (0x00, 0x01, 0x02, 0x03, 0x04, 0x05, 0x10, 0x11) # ABS_X/Y/Z, ABS_RX/RY/RZ, ABS_HAT0X/HAT0Y
+GAMEPAD_BTN_CODES = (0x130, 0x131, 0x133, 0x134, 0x136, 0x137, 0x13a, 0x13b, 0x13c, 0x13d, 0x13e) # BTN_SOUTH ... BTN_THUMBR
+KEY_STATE_BYTES = (0x2ff + 7) // 8 # KEY_MAX bits
+ABSINFO_FORMAT = str('iiiiii') # value, minimum, maximum, fuzz, flat, resolution
+
+def _evdev_ior(nr, size):
+    return (2 << 30) | (size << 16) | (ord('E') << 8) | nr
+
+EVIOCGKEY = _evdev_ior(0x18, KEY_STATE_BYTES)
+def EVIOCGABS(code):
+    return _evdev_ior(0x40 + code, struct.calcsize(ABSINFO_FORMAT))
+
+# State published while no gamepad dongle is connected, built once and shared by all controllers.
+# Like every published state it is read-only; the proxy enforces that for the shared instance.
+ZERO_GAMEPAD_STATE = types.MappingProxyType({'middle_led_ring_button_pressed': False,
+                                              'left_stick_x': 0.0,
+                                              'left_stick_y': 0.0,
+                                              'right_stick_x': 0.0,
+                                              'right_stick_y': 0.0,
+                                              'left_stick_button_pressed': False,
+                                              'right_stick_button_pressed': False,
+                                              'bottom_button_pressed': False,
+                                              'top_button_pressed': False,
+                                              'left_button_pressed': False,
+                                              'right_button_pressed': False,
+                                              'left_shoulder_button_pressed': False,
+                                              'right_shoulder_button_pressed': False,
+                                              'select_button_pressed': False,
+                                              'start_button_pressed': False,
+                                              'left_trigger_pulled': 0.0,
+                                              'right_trigger_pulled': 0.0,
+                                              'bottom_pad_pressed': False,
+                                              'top_pad_pressed': False,
+                                              'left_pad_pressed': False,
+                                              'right_pad_pressed': False})
+
 class Stick():
+    __slots__ = ('x', 'y', 'norm', 'inv_norm')
+
     def __init__(self):
         # joystick pushed
         #   all the way down: y = -1.0
@@ -21,18 +69,21 @@ class Stick():
         self.y = 0.0
         # normalized signed 16 bit integers to be in the range [-1.0, 1.0]
         self.norm = float(pow(2, 15))
+        self.inv_norm = 1.0 / self.norm
 
     def update_x(self, abs_x):
-        self.x = int(abs_x) / self.norm
+        self.x = int(abs_x) * self.inv_norm
 
     def update_y(self, abs_y):
-        self.y = -int(abs_y) / self.norm
+        self.y = -int(abs_y) * self.inv_norm
 
     def print_string(self):
         return 'x: {0:4.2f}, y:{1:4.2f}'.format(self.x, self.y)
 
 
 class Button():
+    __slots__ = ('pressed',)
+
     def __init__(self):
         self.pressed = False
 
@@ -47,6 +98,8 @@ class Button():
 
 
 class Trigger():
+    __slots__ = ('norm', 'pulled')
+
     def __init__(self, xbox_one=False):
         # Xbox One trigger
         #   not pulled = 0
@@ -67,12 +120,10 @@ class Trigger():
         self.pulled = 0.0
 
     def update(self, state):
-        self.pulled = int(state) / self.norm
         # Ensure that the pulled value is not greater than 1.0, which
         # will can happen with the use of an Xbox One controller, if
         # the option was not properly set.
-        if self.pulled > 1.0:
-            self.pulled = 1.0
+        self.pulled = min(int(state) / self.norm, 1.0)
 
     def print_string(self):
         return '{0:4.2f}'.format(self.pulled)
@@ -94,15 +145,30 @@ class GamePadController(threading.Thread):
             - Xbox One Controller connected via Bluetooth
             - Xbox 360 Controller connected with an Insten Wireless Controller USB Charging Cable
             +/- VOYEE Wired Xbox 360 Controller mostly worked, but it had various issues including false middle LED button presses, phantom shoulder button presses, and low joystick sensitivity that made small motions more difficult to execute.
+
+       Input latency is bounded by the USB HID poll interval (often 8ms). For gamepads driven by usbhid, pass
+       usbhid_jspoll=1 (requires root) to request 1ms polling. The setting only applies to devices bound after it
+       is written, so replug the dongle afterwards. Instead of passing usbhid_jspoll, the setting can be persisted
+       (installing any of these also requires root) through `usbhid.jspoll=1` on the kernel command line, an
+       `options usbhid jspoll=1` line in /etc/modprobe.d/, or a udev rule such as:
+            ACTION=="add", SUBSYSTEM=="module", KERNEL=="usbhid", RUN+="/bin/sh -c 'echo 1 > /sys/module/usbhid/parameters/jspoll'"
+       Dongles bound to the xpad driver use the interval from their USB descriptor and are not affected.
     '''
 
-    def __init__(self, print_events=False, print_dongle_status = True):
+    USBHID_JSPOLL_PATH = '/sys/module/usbhid/parameters/jspoll'
+
+    def __init__(self, print_events=False, print_dongle_status = True, usbhid_jspoll=None):
         threading.Thread.__init__(self, name = self.__class__.__name__)
         self.print_events = print_events
+        if usbhid_jspoll is not None:
+            self.set_usbhid_jspoll(usbhid_jspoll)
         self.devices = GamePadDevice()
         self.is_gamepad_dongle = False
         self._i = 0
         self.print_dongle_status = print_dongle_status
+        # Track connection transitions so status messages print once per unplug/replug, not per retry
+        self._read_failing = False
+        self._dongle_missing = False
         
         self.left_stick = Stick()
         self.right_stick = Stick()
@@ -133,195 +199,321 @@ class GamePadController(threading.Thread):
         self.top_pad = Button()
         self.bottom_pad = Button()
 
-        self.lock = threading.Lock()
+        # Event code -> handler taking the event state
+        self._handlers = {'ABS_X': self.left_stick.update_x,
+                          'ABS_Y': self.left_stick.update_y,
+                          'ABS_RX': self.right_stick.update_x,
+                          'ABS_RY': self.right_stick.update_y,
+                          'BTN_MODE': self.middle_led_ring_button.update, # This is the glowing X button on an authentic Xbox controller
+                          'BTN_SOUTH': self.bottom_button.update, # green A, bottom button
+                          'BTN_WEST': self.top_button.update, # yellow Y, ***top button*** WEIRD!
+                          'BTN_NORTH': self.left_button.update, # blue X, ***left button*** WEIRD!
+                          'BTN_EAST': self.right_button.update, # red B, right button
+                          'BTN_TL': self.left_shoulder_button.update, # left shoulder button
+                          'BTN_TR': self.right_shoulder_button.update, # right shoulder button
+                          'ABS_Z': self.left_trigger.update, # left trigger 0-1023
+                          'ABS_RZ': self.right_trigger.update, # right trigger 0-1023
+                          'BTN_SELECT': self.select_button.update, # 1/0
+                          'BTN_START': self.start_button.update, # 1/0
+                          'BTN_THUMBL': self.left_stick_button.update, # 1/0
+                          'BTN_THUMBR': self.right_stick_button.update, # 1/0
+                          'ABS_HAT0Y': self._update_pad_y, # -1 up / 1 down
+                          'ABS_HAT0X': self._update_pad_x} # -1 left / 1 right
+
         # self.thread = threading.Thread(target=self.update,name="GamepadEvents_thread")
         self.daemon = True
-        self.stop_thread = False
         self.shutdown_flag = threading.Event()
+        # Max time (s) a blocking read waits for gamepad events before re-checking for shutdown
+        self.read_timeout = 0.5
+        # Time (s) between scans for the gamepad dongle while it is not plugged in
+        self.dongle_poll_interval = 0.1
+        # Max number of queued events pulled from the event device per read syscall
+        self.read_batch_size = 64
+        # The selector and the wakeup pipe stop() writes to are created with the first device open,
+        # so a controller that is never started holds no fds
+        self._selector = None
+        self._wakeup_r = None
+        self._wakeup_w = None
+        self._wakeup_lock = threading.Lock() # stop() must not write to the pipe once run() has closed it
+        self._gamepad_file = None
+        self._read_buf = None
+        self._read_view = None
         
         self.set_zero_state()
         self.gamepad_state = self.get_state()
     
     def run(self):
-        while not self.shutdown_flag.is_set():
-            if not self.shutdown_flag.is_set():
+        try:
+            while not self.shutdown_flag.is_set():
                 self.update()
+        finally:
+            self._close()
+
+    def _open_selector(self):
+        with self._wakeup_lock:
+            self._selector = selectors.DefaultSelector()
+            self._wakeup_r, self._wakeup_w = os.pipe()
+            self._selector.register(self._wakeup_r, selectors.EVENT_READ)
+            if self.shutdown_flag.is_set():
+                os.write(self._wakeup_w, b'\0')
+
+    def _close(self):
+        with self._wakeup_lock:
+            if self._gamepad_file is not None:
+                self._gamepad_file.close()
+                self._gamepad_file = None
+            if self._selector is None:
+                return
+            self._selector.close()
+            self._selector = None
+            os.close(self._wakeup_r)
+            os.close(self._wakeup_w)
+            self._wakeup_r = self._wakeup_w = None
         
     def get_gamepad(self):
-        """Get a single action from a gamepad."""
+        """Wait up to read_timeout for gamepad events and return every queued event (empty list on timeout).
+
+        The event device is opened unbuffered and non-blocking and registered once with an epoll
+        selector, so the thread sleeps in the kernel until the dongle delivers a HID report, and
+        each wakeup drains the whole kernel queue so the latest sample always wins.
+        """
         try:
             gamepad = self.devices.gamepads[0]
-            return gamepad.read()
         except Exception as e:
             raise UnpluggedError("No gamepad found.")
+        if gamepad._character_file is None:
+            self._open_gamepad(gamepad)
+        if not self._selector.select(self.read_timeout) or self.shutdown_flag.is_set():
+            return []
+        # Raw evdev records are read into a reused buffer rather than a new bytes object per read
+        # (decoding still creates one event per record); a non-blocking read returns None once the
+        # queue is empty
+        events = []
+        n = self._gamepad_file.readinto(self._read_buf)
+        while n:
+            for tv_sec, tv_usec, ev_type, code, value in struct.iter_unpack(EVENT_FORMAT, self._read_view[:n]):
+                events.append(gamepad._make_event(tv_sec, tv_usec, ev_type, code, value))
+            n = self._gamepad_file.readinto(self._read_buf)
+        return self._latest_events(gamepad, events)
+
+    def _latest_events(self, gamepad, events):
+        """Collapse a drained batch to the newest event per code.
+
+        If the reader fell behind and the kernel queue overflowed (SYN_DROPPED), the queued events are
+        incomplete and stale, so they are discarded and the current device state is read back instead.
+        """
+        latest = {}
+        for event in events:
+            if event.code == 'SYN_DROPPED':
+                return self._read_device_state(gamepad)
+            latest[event.code] = event
+        return list(latest.values())
+
+    def _read_device_state(self, gamepad):
+        fd = gamepad._character_file.fileno()
+        events = []
+        for code in GAMEPAD_ABS_CODES:
+            try:
+                absinfo = fcntl.ioctl(fd, EVIOCGABS(code), bytes(struct.calcsize(ABSINFO_FORMAT)))
+            except (IOError, OSError):
+                continue # axis not present on this gamepad
+            events.append(gamepad._make_event(0, 0, EV_ABS, code, struct.unpack(ABSINFO_FORMAT, absinfo)[0]))
+        try:
+            keys = bytearray(fcntl.ioctl(fd, EVIOCGKEY, bytes(KEY_STATE_BYTES)))
+        except (IOError, OSError):
+            return events # buttons keep their last state until their next press/release event
+        for code in GAMEPAD_BTN_CODES:
+            events.append(gamepad._make_event(0, 0, EV_KEY, code, (keys[code >> 3] >> (code & 7)) & 1))
+        return events
+
+    def _open_gamepad(self, gamepad):
+        if self._selector is None:
+            self._open_selector()
+        if self._gamepad_file is not None:
+            # Device manager was re-initialized after a disconnect, drop the stale device
+            self._selector.unregister(self._gamepad_file)
+            self._gamepad_file.close()
+            self._gamepad_file = None
+        # Only attach the file once it is fully set up, so a failed open (e.g. udev has not applied
+        # permissions yet after a replug) is simply retried on the next update
+        f = io.open(gamepad.get_char_device_path(), 'rb', buffering=0)
+        try:
+            fd = f.fileno()
+            fcntl.fcntl(fd, fcntl.F_SETFL, fcntl.fcntl(fd, fcntl.F_GETFL) | os.O_NONBLOCK)
+            self._selector.register(f, selectors.EVENT_READ)
+        except Exception:
+            f.close()
+            raise
+        if self._read_buf is None or len(self._read_buf) != self.read_batch_size * EVENT_SIZE:
+            self._read_buf = bytearray(self.read_batch_size * EVENT_SIZE)
+            self._read_view = memoryview(self._read_buf)
+        gamepad._character_file = f
+        self._gamepad_file = f
         
-    # def start(self):
-    #     self.stop_thread = False
-        # self.thread.start()
+    def set_usbhid_jspoll(self, interval_ms):
+        """Set the usbhid joystick poll interval (ms). Returns True on success."""
+        if os.geteuid() != 0:
+            click.secho("Setting usbhid jspoll requires root, skipping", fg="yellow")
+            return False
+        try:
+            with open(self.USBHID_JSPOLL_PATH, 'w') as f:
+                f.write(str(int(interval_ms)))
+            return True
+        except (IOError, OSError) as e:
+            click.secho("Unable to set usbhid jspoll: {0}".format(e), fg="yellow")
+            return False
 
     def stop(self):
-        if not self.stop_thread:
-            with self.lock:
-                self.stop_thread = True
+        with self._wakeup_lock:
+            if not self.shutdown_flag.is_set():
+                self.shutdown_flag.set()
+                if self._wakeup_w is not None:
+                    os.write(self._wakeup_w, b'\0')
             # self.thread.join() # Thread._wait_for_tstate_lock() never returns if trying to join this thread
     
     def poll_till_gamepad_dongle_present(self):
         # self.is_gamepad_dongle = False
         # while not self.is_gamepad_dongle:
-        with self.lock:
-            self.is_gamepad_dongle = False
+        self.is_gamepad_dongle = False
         if self._i % 50 == 0 and self.print_dongle_status:
             click.secho("Waiting for Gamepad Dongle.................", fg="yellow")
         try:
             self.devices.__init__()
             if len(self.devices.gamepads)>0:
-                click.secho("Gamepad Dongle FOUND!", fg="green", bold=True)
-                with self.lock:
-                    self.is_gamepad_dongle = True 
+                if self._dongle_missing and not self._read_failing:
+                    # After a failed read, update() reports the recovery once reads succeed again
+                    click.secho("Gamepad Dongle FOUND!", fg="green", bold=True)
+                self._dongle_missing = False
+                self._reset_inputs()
+                self.is_gamepad_dongle = True
         except Exception as e:
             pass
+        if not self.is_gamepad_dongle:
+            self._dongle_missing = True
+            # Rescanning /dev/input back-to-back would pin a core while the dongle is unplugged
+            self.shutdown_flag.wait(self.dongle_poll_interval)
 
     def update(self):
-        while not self.stop_thread:
-            self._i = self._i+1
-            if len(self.devices.gamepads)>0:
-                self.is_gamepad_dongle = True
-                try:
-                    events = self.get_gamepad()
-                    self.update_button_encodings(events)
-                except (OSError, UnpluggedError, Exception) as e:
+        self._i = self._i+1
+        if len(self.devices.gamepads)>0:
+            self.is_gamepad_dongle = True
+            try:
+                events = self.get_gamepad()
+                if self._read_failing:
+                    click.secho("Gamepad Dongle FOUND!", fg="green", bold=True)
+                    self._read_failing = False
+                self.update_button_encodings(events)
+            except (OSError, UnpluggedError, Exception) as e:
+                if not self._read_failing:
                     click.secho("Gamepad Dongle DISCONNECTED........", fg="red", bold=True)
-                    self.poll_till_gamepad_dongle_present()
-            else:
-                self.is_gamepad_dongle = False
+                    self._read_failing = True
+                self.set_zero_state()
+                self.gamepad_state = self.get_state()
+                # The dongle may still be listed while its device can't be read (e.g. no permission),
+                # so back off before rescanning instead of retrying back-to-back
+                self.shutdown_flag.wait(self.dongle_poll_interval)
                 self.poll_till_gamepad_dongle_present()
-            if not self.is_gamepad_dongle:
-                if self._i % 2 == 0:
-                    self.set_zero_state()
-            self.gamepad_state = self.get_state()
+        else:
+            self.is_gamepad_dongle = False
+            self.poll_till_gamepad_dongle_present()
+        if not self.is_gamepad_dongle:
+            self.set_zero_state()
+        self.gamepad_state = self.get_state()
                 
     def update_button_encodings(self,events):
-        with self.lock:
-            for event in events:
-                if event.code == 'ABS_X':
-                    self.left_stick.update_x(event.state)
-                if event.code == 'ABS_Y':
-                    self.left_stick.update_y(event.state)
-                if event.code == 'ABS_RX':
-                    self.right_stick.update_x(event.state)
-                if event.code == 'ABS_RY':
-                    self.right_stick.update_y(event.state)
-
-                # This is the glowing X button on an authentic Xbox controller
-                if event.code == 'BTN_MODE':
-                    self.middle_led_ring_button.update(event.state)
-
-                if event.code == 'BTN_SOUTH':  # green A, bottom button
-                    self.bottom_button.update(event.state)
-                if event.code == 'BTN_WEST':  # yellow Y, ***top button*** WEIRD!
-                    self.top_button.update(event.state)
-                if event.code == 'BTN_NORTH':  # blue X, ***left button*** WEIRD!
-                    self.left_button.update(event.state)
-                if event.code == 'BTN_EAST':  # red B, right button
-                    self.right_button.update(event.state)
-
-                if event.code == 'BTN_TL':  # left shoulder button
-                    self.left_shoulder_button.update(event.state)
-                if event.code == 'BTN_TR':  # right shoulder button
-                    self.right_shoulder_button.update(event.state)
-
-                if event.code == 'ABS_Z':  # left trigger 0-1023
-                    self.left_trigger.update(event.state)
-                if event.code == 'ABS_RZ':  # right trigger 0-1023
-                    self.right_trigger.update(event.state)
-
-                if event.code == 'BTN_SELECT':  # 1/0
-                    self.select_button.update(event.state)
-                if event.code == 'BTN_START':  # 1/0
-                    self.start_button.update(event.state)
-
-                if event.code == 'BTN_THUMBL':  # 1/0
-                    self.left_stick_button.update(event.state)
-                if event.code == 'BTN_THUMBR':  # 1/0
-                    self.right_stick_button.update(event.state)
-
-                # 4-way pad
-                if event.code == 'ABS_HAT0Y':  # -1 up / 1 down
-                    if event.state == 0:
-                        self.top_pad.update(0)
-                        self.bottom_pad.update(0)
-                    elif event.state == 1:
-                        self.top_pad.update(0)
-                        self.bottom_pad.update(1)
-                    elif event.state == -1:
-                        self.bottom_pad.update(0)
-                        self.top_pad.update(1)
-
-                if event.code == 'ABS_HAT0X':  # -1 left / 1 right
-                    if event.state == 0:
-                        self.left_pad.update(0)
-                        self.right_pad.update(0)
-                    elif event.state == 1:
-                        self.left_pad.update(0)
-                        self.right_pad.update(1)
-                    elif event.state == -1:
-                        self.right_pad.update(0)
-                        self.left_pad.update(1)
-
-                if self.print_events:
-                    print(event.ev_type, event.code, event.state)
+        handlers = self._handlers
+        for event in events:
+            handler = handlers.get(event.code)
+            if handler is not None:
+                handler(event.state)
+
+            if self.print_events:
+                print(event.ev_type, event.code, event.state)
+        if events:
+            self._publish_state()
+
+    # 4-way pad
+    def _update_pad_y(self, state):
+        if state == 0:
+            self.top_pad.update(0)
+            self.bottom_pad.update(0)
+        elif state == 1:
+            self.top_pad.update(0)
+            self.bottom_pad.update(1)
+        elif state == -1:
+            self.bottom_pad.update(0)
+            self.top_pad.update(1)
+
+    def _update_pad_x(self, state):
+        if state == 0:
+            self.left_pad.update(0)
+            self.right_pad.update(0)
+        elif state == 1:
+            self.left_pad.update(0)
+            self.right_pad.update(1)
+        elif state == -1:
+            self.right_pad.update(0)
+            self.left_pad.update(1)
     
     def set_zero_state(self):
-        with self.lock:
-            self.middle_led_ring_button.pressed = False
-            self.left_stick.x = 0
-            self.left_stick.y = 0
-            self.right_stick.x = 0
-            self.right_stick.y = 0
-
-            self.left_stick_button.pressed = False
-            self.right_stick_button.pressed = False
-            self.bottom_button.pressed = False
-            self.top_button.pressed = False
-            self.left_button.pressed = False
-            self.right_button.pressed = False
-            self.left_shoulder_button.pressed = False
-            self.right_shoulder_button.pressed = False
-            self.select_button.pressed = False
-            self.start_button.pressed = False
-            self.bottom_pad.pressed = False
-            self.top_pad.pressed = False
-            self.left_pad.pressed = False
-            self.right_pad.pressed = False
-            
-            self.left_trigger.pulled = 0
-            self.right_trigger.pulled = 0
+        self._snapshot = ZERO_GAMEPAD_STATE
+
+    def _reset_inputs(self):
+        # The fields keep their last values while the published state is zeroed, so clear them (and
+        # republish) before new events from a (re)connected gamepad are applied on top
+        self.middle_led_ring_button.pressed = False
+        self.left_stick.x = 0.0
+        self.left_stick.y = 0.0
+        self.right_stick.x = 0.0
+        self.right_stick.y = 0.0
+
+        self.left_stick_button.pressed = False
+        self.right_stick_button.pressed = False
+        self.bottom_button.pressed = False
+        self.top_button.pressed = False
+        self.left_button.pressed = False
+        self.right_button.pressed = False
+        self.left_shoulder_button.pressed = False
+        self.right_shoulder_button.pressed = False
+        self.select_button.pressed = False
+        self.start_button.pressed = False
+        self.bottom_pad.pressed = False
+        self.top_pad.pressed = False
+        self.left_pad.pressed = False
+        self.right_pad.pressed = False
+        
+        self.left_trigger.pulled = 0.0
+        self.right_trigger.pulled = 0.0
+        self._publish_state()
+
+    def _publish_state(self):
+        # Only the reader thread mutates the button/stick/trigger fields. Consumers see a fresh
+        # dict that is swapped in with a single (atomic) attribute assignment, so no lock is needed.
+        self._snapshot = {'middle_led_ring_button_pressed': self.middle_led_ring_button.pressed,
+                          'left_stick_x': self.left_stick.x,
+                          'left_stick_y': self.left_stick.y,
+                          'right_stick_x': self.right_stick.x,
+                          'right_stick_y': self.right_stick.y,
+                          'left_stick_button_pressed': self.left_stick_button.pressed,
+                          'right_stick_button_pressed': self.right_stick_button.pressed,
+                          'bottom_button_pressed': self.bottom_button.pressed,
+                          'top_button_pressed': self.top_button.pressed,
+                          'left_button_pressed': self.left_button.pressed,
+                          'right_button_pressed': self.right_button.pressed,
+                          'left_shoulder_button_pressed': self.left_shoulder_button.pressed,
+                          'right_shoulder_button_pressed': self.right_shoulder_button.pressed,
+                          'select_button_pressed': self.select_button.pressed,
+                          'start_button_pressed': self.start_button.pressed,
+                          'left_trigger_pulled': self.left_trigger.pulled,
+                          'right_trigger_pulled': self.right_trigger.pulled,
+                          'bottom_pad_pressed': self.bottom_pad.pressed,
+                          'top_pad_pressed': self.top_pad.pressed,
+                          'left_pad_pressed': self.left_pad.pressed,
+                          'right_pad_pressed': self.right_pad.pressed}
 
     def get_state(self):
-        with self.lock:
-            state = {'middle_led_ring_button_pressed': self.middle_led_ring_button.pressed,
-                     'left_stick_x': self.left_stick.x,
-                     'left_stick_y': self.left_stick.y,
-                     'right_stick_x': self.right_stick.x,
-                     'right_stick_y': self.right_stick.y,
-                     'left_stick_button_pressed': self.left_stick_button.pressed,
-                     'right_stick_button_pressed': self.right_stick_button.pressed,
-                     'bottom_button_pressed': self.bottom_button.pressed,
-                     'top_button_pressed': self.top_button.pressed,
-                     'left_button_pressed': self.left_button.pressed,
-                     'right_button_pressed': self.right_button.pressed,
-                     'left_shoulder_button_pressed': self.left_shoulder_button.pressed,
-                     'right_shoulder_button_pressed': self.right_shoulder_button.pressed,
-                     'select_button_pressed': self.select_button.pressed,
-                     'start_button_pressed': self.start_button.pressed,
-                     'left_trigger_pulled': self.left_trigger.pulled,
-                     'right_trigger_pulled': self.right_trigger.pulled,
-                     'bottom_pad_pressed': self.bottom_pad.pressed,
-                     'top_pad_pressed': self.top_pad.pressed,
-                     'left_pad_pressed': self.left_pad.pressed,
-                     'right_pad_pressed': self.right_pad.pressed}
-        return state
-
+        """Return the latest published gamepad state, a mapping that must be treated as read-only."""
+        return self._snapshot
 
 def main():
     gamepad_controller = GamePadController(print_events=False)
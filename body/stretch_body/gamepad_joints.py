@@ -75,7 +75,7 @@ class CommandBase:
             self.start_theta = None
             v_m, w_r = self._process_stick_to_vel(x,y, robot)
             robot.base.set_velocity(v_m, w_r, a=self.acc)
-            self._prev_set_vel_ts = time.time()
+            self._prev_set_vel_ts = time.monotonic()
         else:
         # Precision Mode
             if self.start_pos is None:
@@ -94,7 +94,7 @@ class CommandBase:
             else:
                 self._step_precision_translate(yv, robot)
             # Update the previous_time for the next iteration
-            self._prev_set_vel_ts = time.time()
+            self._prev_set_vel_ts = time.monotonic()
     
     def command_button_to_rotation_motion(self, direction, robot):
         """Make robot base rotation motion based on a button state.
@@ -111,7 +111,7 @@ class CommandBase:
             w_r = direction*self.precision_max_rot_vel
         robot.base.set_velocity(v_m, w_r, a=self.acc)
         # Update the previous_time for the next iteration
-        self._prev_set_vel_ts = time.time()
+        self._prev_set_vel_ts = time.monotonic()
 
     def command_button_to_linear_motion(self, direction, robot):
         """Make robot base linear motion based on a button state.
@@ -128,7 +128,7 @@ class CommandBase:
             v_m = direction*self.precision_max_linear_vel
         robot.base.set_velocity(v_m, w_r, a=self.acc)
         # Update the previous_time for the next iteration
-        self._prev_set_vel_ts = time.time()
+        self._prev_set_vel_ts = time.monotonic()
     
     def stop_motion(self, robot):
         """Stop the joint motion. To be used when ever the controller is idle/no-inputs
@@ -171,7 +171,7 @@ class CommandBase:
             
     def _step_precision_rotate(self, xv, robot):
         # Calculate the time elapsed since the last iteration
-        current_time = time.time()
+        current_time = time.monotonic()
         elapsed_time = current_time - self._prev_set_vel_ts 
 
         # Calculate the desired change in position to achieve the desired velocity
@@ -184,7 +184,7 @@ class CommandBase:
     def _step_precision_translate(self, yv, robot):
         
         # Calculate the time elapsed since the last iteration
-        current_time = time.time()
+        current_time = time.monotonic()
         elapsed_time = current_time - self._prev_set_vel_ts 
 
         # Calculate the desired change in position to achieve the desired velocity
@@ -229,7 +229,7 @@ class CommandLift:
             self.stopped_for_precision = False
             v_m = self._process_stick_to_vel(x)
             robot.lift.set_velocity(v_m, a_m=self.acc)
-            self._prev_set_vel_ts = time.time()
+            self._prev_set_vel_ts = time.monotonic()
             # print(f"[CommandLift]  X: {x} || v_m: {self.safety_v_m}")
         else:
         # Precision Mode
@@ -281,7 +281,7 @@ class CommandLift:
         current_position = robot.lift.status['pos']
 
         # Calculate the time elapsed since the last iteration
-        current_time = time.time()
+        current_time = time.monotonic()
         elapsed_time = current_time - self._prev_set_vel_ts 
 
         # Calculate the desired change in position to achieve the desired velocity
@@ -300,7 +300,7 @@ class CommandLift:
         robot.lift.move_to(self.start_pos + x_des)
 
         # Update the previous_time for the next iteration
-        self._prev_set_vel_ts = time.time()
+        self._prev_set_vel_ts = time.monotonic()
 
 class CommandArm:
     def __init__(self):
@@ -336,7 +336,7 @@ class CommandArm:
             self.stopped_for_precision = False
             v_m = self._process_stick_to_vel(x)
             robot.arm.set_velocity(v_m,a_m=self.acc)
-            self._prev_set_vel_ts = time.time()
+            self._prev_set_vel_ts = time.monotonic()
         else:
         # Precision Mode
             if abs(robot.arm.status['vel'])>0.001 and not self.stopped_for_precision:
@@ -387,7 +387,7 @@ class CommandArm:
         current_position = robot.arm.status['pos']
 
         # Calculate the time elapsed since the last iteration
-        current_time = time.time()
+        current_time = time.monotonic()
         elapsed_time = current_time - self._prev_set_vel_ts 
 
         # Calculate the desired change in position to achieve the desired velocity
@@ -407,7 +407,7 @@ class CommandArm:
             robot.arm.move_to(self.start_pos + x_des)
 
         # Update the previous_time for the next iteration
-        self._prev_set_vel_ts = time.time()
+        self._prev_set_vel_ts = time.monotonic()
 
 class CommandDxlJoint:
     """Abstract motion command class for Dynamixel joints
@@ -453,7 +453,7 @@ class CommandDxlJoint:
         if self.precision_mode:
             v = v*self.precision_scale_down
         motor.set_velocity(v, acc)
-        self._prev_set_vel_ts = time.time()
+        self._prev_set_vel_ts = time.monotonic()
 
     def command_button_to_motion(self,direction, robot):
         """Make servo move based on a button state.
@@ -473,7 +473,7 @@ class CommandDxlJoint:
             motor.set_velocity(vel, self.acc)
         elif direction==-1:
             motor.set_velocity(-1*vel, self.acc)
-        self._prev_set_vel_ts = time.time()
+        self._prev_set_vel_ts = time.monotonic()
     
     def stop_motion(self, robot):
         """Stop the joint motion. To be used when ever the controller is idle/no-inputs
@@ -334,10 +334,11 @@ class GamePadTeleop(Device):
         """Switch the D-Pad between DexWrist and Head Control by a 2s button press
         """    
         if button_state:
+            now = time.monotonic()
             if not self._last_fn_btn_press:
-                self._last_fn_btn_press = time.time()
+                self._last_fn_btn_press = now
 
-            if time.time() - self._last_fn_btn_press >= 2:
+            if now - self._last_fn_btn_press >= 2:
                 self.do_single_beep(robot)
                 self._last_fn_btn_press = None
                 self.stow_robot(robot)
@@ -351,10 +352,11 @@ class GamePadTeleop(Device):
             return
 
         if button_state:
+            now = time.monotonic()
             if not self._last_left_stick_fn_btn_press:
-                self._last_left_stick_fn_btn_press = time.time()
+                self._last_left_stick_fn_btn_press = now
 
-            if time.time() - self._last_left_stick_fn_btn_press >= self.fn_button_detect_span:
+            if now - self._last_left_stick_fn_btn_press >= self.fn_button_detect_span:
                 click.secho("Executing Left Stick Custom Function", fg="green", bold=True)
                 self.left_stick_button_fn()
                 self._last_left_stick_fn_btn_press = None
@@ -368,10 +370,11 @@ class GamePadTeleop(Device):
             return
 
         if button_state:
+            now = time.monotonic()
             if not self._last_right_stick_fn_btn_press:
-                self._last_right_stick_fn_btn_press = time.time()
+                self._last_right_stick_fn_btn_press = now
 
-            if time.time() - self._last_right_stick_fn_btn_press >= self.fn_button_detect_span:
+            if now - self._last_right_stick_fn_btn_press >= self.fn_button_detect_span:
                 click.secho("Executing right Stick Custom Function", fg="green", bold=True)
                 self.right_stick_button_fn()
                 self._last_right_stick_fn_btn_press = None
@@ -383,10 +386,11 @@ class GamePadTeleop(Device):
         """    
         if self.params['enable_fn_button']: 
             if button_state:
+                now = time.monotonic()
                 if not self._last_fn_btn_press:
-                    self._last_fn_btn_press = time.time()
+                    self._last_fn_btn_press = now
 
-                if time.time() - self._last_fn_btn_press >= self.fn_button_detect_span:
+                if now - self._last_fn_btn_press >= self.fn_button_detect_span:
                     self._last_fn_btn_press = None
                     click.secho(f"Executing Function command: {self.fn_button_command}", fg="green", bold=True)
                     self.do_four_beep(robot)
@@ -421,8 +425,8 @@ class GamePadTeleop(Device):
     def stop(self):
         if self._needs_robot_startup:
             self.robot.stop()
-        if not self.gamepad_controller.stop_thread:
-            self.gamepad_controller.shutdown_flag.set()
+        if not self.gamepad_controller.shutdown_flag.is_set():
+            self.gamepad_controller.stop()
             self.gamepad_controller.join(1)
     
     def manage_shutdown(self, robot):
@@ -432,9 +436,10 @@ class GamePadTeleop(Device):
             robot (robot.Robot): Valid robot instance.
         """
         if self.controller_state['select_button_pressed']:
+            now = time.monotonic()
             if not self._last_shutdwon_btn_press:
-                self._last_shutdwon_btn_press = time.time()
-            if time.time() - self._last_shutdwon_btn_press >= 2:
+                self._last_shutdwon_btn_press = now
+            if now - self._last_shutdwon_btn_press >= 2:
                 print("Shutting Down the Robot...")
                 self._last_shutdwon_btn_press = None
                 robot.pimu.trigger_beep()
@@ -0,0 +1,255 @@
+import unittest
+import os
+import struct
+import tempfile
+import shutil
+import io
+import contextlib
+import time
+from unittest import mock
+
+import inputs
+import stretch_body.gamepad_controller as gc
+
+
+class TestGamePadController(unittest.TestCase):
+    """Feeds raw evdev records through a FIFO standing in for the gamepad's event device, no hardware needed"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        pad, self.event_fd = self.make_pad('event0')
+        self.gc = self.make_controller(pad)
+
+    def tearDown(self):
+        self.gc._close()
+        os.close(self.event_fd)
+        shutil.rmtree(self.tmp_dir)
+
+    def make_pad(self, name):
+        event_path = os.path.join(self.tmp_dir, name)
+        os.mkfifo(event_path)
+        # Holding the FIFO open read/write lets the controller open it without blocking and never see EOF
+        event_fd = os.open(event_path, os.O_RDWR)
+        pad = object.__new__(inputs.GamePad)
+        pad.manager = inputs.devices
+        pad.read_size = 1
+        pad._character_file = None
+        pad._character_device_path = event_path
+        return pad, event_fd
+
+    def make_controller(self, pad):
+        controller = gc.GamePadController(print_dongle_status=False)
+        if pad is not None:
+            controller.devices.gamepads = [pad]
+        controller.read_timeout = 0.05
+        controller.dongle_poll_interval = 0.01
+        return controller
+
+    def write_event(self, ev_type, code, value):
+        os.write(self.event_fd, struct.pack(inputs.EVENT_FORMAT, 0, 0, ev_type, code, value))
+
+    def test_ioctl_requests(self):
+        # Values of EVIOCGKEY(96) and EVIOCGABS(ABS_X) from linux/input.h
+        self.assertEqual(gc.EVIOCGKEY, 0x80604518)
+        self.assertEqual(gc.EVIOCGABS(0x00), 0x80184540)
+        self.assertEqual(gc.EVIOCGABS(0x11), 0x80184551)
+
+    def test_batch_collapsed_to_newest_per_code(self):
+        for i in range(100):
+            self.write_event(gc.EV_ABS, 0x00, i * 100) # ABS_X
+            self.write_event(0x00, 0x00, 0) # SYN_REPORT
+        self.write_event(gc.EV_KEY, 0x130, 1) # BTN_SOUTH
+        self.write_event(gc.EV_KEY, 0x130, 0)
+        self.write_event(0x00, 0x00, 0)
+        events = self.gc.get_gamepad()
+        codes = [e.code for e in events]
+        self.assertEqual(sorted(codes), sorted(set(codes)))
+        latest = dict((e.code, e.state) for e in events)
+        self.assertEqual(latest['ABS_X'], 9900)
+        self.assertEqual(latest['BTN_SOUTH'], 0)
+
+        self.gc.update_button_encodings(events)
+        state = self.gc.get_state()
+        self.assertAlmostEqual(state['left_stick_x'], 9900 / 32768.0)
+        self.assertFalse(state['bottom_button_pressed'])
+
+    def test_syn_dropped_resyncs_device_state(self):
+        key_state = bytearray(gc.KEY_STATE_BYTES)
+        key_state[0x13b >> 3] |= 1 << (0x13b & 7) # BTN_START held
+
+        def fake_ioctl(fd, request, arg):
+            if request == gc.EVIOCGKEY:
+                return bytes(key_state)
+            if request == gc.EVIOCGABS(0x00): # ABS_X
+                return struct.pack(gc.ABSINFO_FORMAT, 16384, -32768, 32767, 16, 128, 0)
+            raise OSError('axis not supported')
+
+        self.write_event(gc.EV_KEY, 0x130, 1) # BTN_SOUTH, stale
+        self.write_event(gc.EV_ABS, 0x01, 20000) # ABS_Y, stale
+        self.write_event(0x00, 0x03, 0) # SYN_DROPPED
+        self.write_event(gc.EV_ABS, 0x00, -100) # ABS_X, incomplete report
+        self.write_event(0x00, 0x00, 0) # SYN_REPORT
+        with mock.patch.object(gc.fcntl, 'ioctl', side_effect=fake_ioctl):
+            self.gc.update()
+        state = self.gc.get_state()
+        self.assertTrue(self.gc.is_gamepad_dongle)
+        self.assertAlmostEqual(state['left_stick_x'], 0.5)
+        self.assertEqual(state['left_stick_y'], 0.0)
+        self.assertTrue(state['start_button_pressed'])
+        self.assertFalse(state['bottom_button_pressed'])
+
+    def test_syn_dropped_without_key_state(self):
+        self.write_event(0x00, 0x03, 0) # SYN_DROPPED
+        self.write_event(0x00, 0x00, 0)
+        with mock.patch.object(gc.fcntl, 'ioctl', side_effect=OSError('not an evdev device')):
+            self.gc.update()
+        self.assertTrue(self.gc.is_gamepad_dongle)
+        self.assertFalse(self.gc._read_failing)
+
+    def test_event_code_to_state_mapping(self):
+        # (event type, code, value, state key expected to change, expected value)
+        cases = [(gc.EV_ABS, 0x00, 16384, 'left_stick_x', 0.5), # ABS_X
+                 (gc.EV_ABS, 0x01, 16384, 'left_stick_y', -0.5), # ABS_Y
+                 (gc.EV_ABS, 0x03, 16384, 'right_stick_x', 0.5), # ABS_RX
+                 (gc.EV_ABS, 0x04, 16384, 'right_stick_y', -0.5), # ABS_RY
+                 (gc.EV_ABS, 0x02, 255, 'left_trigger_pulled', 1.0), # ABS_Z
+                 (gc.EV_ABS, 0x05, 255, 'right_trigger_pulled', 1.0), # ABS_RZ
+                 (gc.EV_KEY, 0x13c, 1, 'middle_led_ring_button_pressed', True), # BTN_MODE
+                 (gc.EV_KEY, 0x130, 1, 'bottom_button_pressed', True), # BTN_SOUTH
+                 (gc.EV_KEY, 0x131, 1, 'right_button_pressed', True), # BTN_EAST
+                 (gc.EV_KEY, 0x133, 1, 'left_button_pressed', True), # BTN_NORTH
+                 (gc.EV_KEY, 0x134, 1, 'top_button_pressed', True), # BTN_WEST
+                 (gc.EV_KEY, 0x136, 1, 'left_shoulder_button_pressed', True), # BTN_TL
+                 (gc.EV_KEY, 0x137, 1, 'right_shoulder_button_pressed', True), # BTN_TR
+                 (gc.EV_KEY, 0x13a, 1, 'select_button_pressed', True), # BTN_SELECT
+                 (gc.EV_KEY, 0x13b, 1, 'start_button_pressed', True), # BTN_START
+                 (gc.EV_KEY, 0x13d, 1, 'left_stick_button_pressed', True), # BTN_THUMBL
+                 (gc.EV_KEY, 0x13e, 1, 'right_stick_button_pressed', True), # BTN_THUMBR
+                 (gc.EV_ABS, 0x10, -1, 'left_pad_pressed', True), # ABS_HAT0X
+                 (gc.EV_ABS, 0x10, 1, 'right_pad_pressed', True),
+                 (gc.EV_ABS, 0x11, -1, 'top_pad_pressed', True), # ABS_HAT0Y
+                 (gc.EV_ABS, 0x11, 1, 'bottom_pad_pressed', True)]
+        pad = self.gc.devices.gamepads[0]
+        zero_state = dict(gc.ZERO_GAMEPAD_STATE)
+        for ev_type, code, value, key, expected in cases:
+            with self.subTest(code=hex(code), value=value):
+                self.gc._reset_inputs()
+                self.gc._publish_state()
+                self.gc.update_button_encodings([pad._make_event(0, 0, ev_type, code, value)])
+                state = self.gc.get_state()
+                changed = [k for k in state if state[k] != zero_state[k]]
+                self.assertEqual(changed, [key])
+                self.assertAlmostEqual(state[key], expected)
+
+    def test_pad_release(self):
+        pad = self.gc.devices.gamepads[0]
+        for code, value in ((0x10, -1), (0x10, 1), (0x11, -1), (0x11, 1)):
+            with self.subTest(code=hex(code), value=value):
+                self.gc.update_button_encodings([pad._make_event(0, 0, gc.EV_ABS, code, value)])
+                self.gc.update_button_encodings([pad._make_event(0, 0, gc.EV_ABS, code, 0)])
+                state = self.gc.get_state()
+                for key in ('left_pad_pressed', 'right_pad_pressed', 'top_pad_pressed', 'bottom_pad_pressed'):
+                    self.assertFalse(state[key])
+
+    def test_zero_state_is_read_only(self):
+        self.gc.set_zero_state()
+        state = self.gc.get_state()
+        self.assertIs(state, gc.ZERO_GAMEPAD_STATE)
+        with self.assertRaises(TypeError):
+            state['left_stick_x'] = 1.0
+        self.assertEqual(gc.ZERO_GAMEPAD_STATE['left_stick_x'], 0.0)
+
+    def test_disconnect_publishes_zero_state(self):
+        self.write_event(gc.EV_KEY, 0x130, 1) # BTN_SOUTH
+        self.write_event(0x00, 0x00, 0)
+        self.gc.update()
+        self.assertTrue(self.gc.gamepad_state['bottom_button_pressed'])
+
+        # Read fails but the rescan lists the gamepad again (e.g. a quick replug)
+        with mock.patch.object(self.gc, 'get_gamepad', side_effect=OSError(19, 'No such device')), \
+                mock.patch.object(type(self.gc.devices), '__init__', lambda devices: None):
+            self.gc.update()
+        self.assertTrue(self.gc.is_gamepad_dongle)
+        self.assertFalse(self.gc.gamepad_state['bottom_button_pressed'])
+        self.assertFalse(self.gc.bottom_button.pressed)
+
+    def test_stop_releases_fds(self):
+        fds_before = len(os.listdir('/proc/self/fd'))
+        for i in range(5):
+            pad, event_fd = self.make_pad('event{0}'.format(i + 1))
+            controller = self.make_controller(pad)
+            controller.start()
+            time.sleep(0.02)
+            controller.stop()
+            controller.join(1)
+            self.assertFalse(controller.is_alive())
+            os.close(event_fd)
+        # Constructed but never started, with and without stop()
+        for i in range(2):
+            controller = self.make_controller(None)
+            if i:
+                controller.stop()
+        self.assertEqual(len(os.listdir('/proc/self/fd')), fds_before)
+
+    def test_failed_reopen_is_retried(self):
+        self.gc.update() # opens the first device, no events
+        self.assertIsNotNone(self.gc._gamepad_file)
+
+        # Dongle replugged: the device manager lists a new device node, whose first open fails
+        pad, event_fd = self.make_pad('event1')
+        self.gc.devices.gamepads = [pad]
+        real_open = io.open
+        attempts = []
+
+        def flaky_open(*args, **kwargs):
+            attempts.append(args[0])
+            if len(attempts) == 1:
+                raise PermissionError(13, 'Permission denied') # udev has not applied permissions yet
+            return real_open(*args, **kwargs)
+
+        os.write(event_fd, struct.pack(inputs.EVENT_FORMAT, 0, 0, gc.EV_KEY, 0x130, 1)) # BTN_SOUTH
+        os.write(event_fd, struct.pack(inputs.EVENT_FORMAT, 0, 0, 0x00, 0x00, 0))
+        try:
+            with mock.patch.object(gc.io, 'open', side_effect=flaky_open), \
+                    mock.patch.object(type(self.gc.devices), '__init__', lambda devices: None):
+                self.gc.update()
+                self.assertIsNone(self.gc._gamepad_file)
+                self.assertIsNone(pad._character_file)
+                self.assertFalse(self.gc.gamepad_state['bottom_button_pressed'])
+                self.gc.update()
+            self.assertEqual(len(attempts), 2)
+            self.assertTrue(self.gc.gamepad_state['bottom_button_pressed'])
+        finally:
+            os.close(event_fd)
+
+    def test_status_messages_pair_up(self):
+        self.gc.update()
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            # Transient read failure, the rescan lists the gamepad again straight away
+            with mock.patch.object(self.gc, 'get_gamepad', side_effect=OSError(19, 'No such device')), \
+                    mock.patch.object(type(self.gc.devices), '__init__', lambda devices: None):
+                self.gc.update()
+                self.gc.update()
+            self.gc.update()
+            self.gc.update()
+        lines = out.getvalue().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertIn('DISCONNECTED', lines[0])
+        self.assertIn('FOUND', lines[1])
+
+    def test_axis_normalization(self):
+        stick = gc.Stick()
+        for raw in range(-32768, 32768, 7):
+            stick.update_x(raw)
+            stick.update_y(raw)
+            self.assertEqual(stick.x, raw / 32768.0)
+            self.assertEqual(stick.y, -raw / 32768.0)
+        for xbox_one, norm in ((False, 255.0), (True, 1023.0)):
+            trigger = gc.Trigger(xbox_one=xbox_one)
+            for raw in range(int(norm) + 1):
+                trigger.update(raw)
+                self.assertEqual(trigger.pulled, raw / norm)
+        trigger = gc.Trigger(xbox_one=False)
+        trigger.update(1023) # Xbox One trigger read with the Xbox 360 scale
+        self.assertEqual(trigger.pulled, 1.0)